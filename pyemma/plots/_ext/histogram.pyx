@@ -0,0 +1,140 @@
+# This file is part of PyEMMA.
+#
+# Copyright (c) 2014-2018 Computational Molecular Biology Group, Freie Universitaet Berlin (GER)
+#
+# PyEMMA is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+r"""
+Fused two-dimensional histogram and free energy kernel.
+"""
+
+cimport cython
+from cython.parallel cimport prange
+from libc.math cimport log as _libc_log, INFINITY
+import os as _os
+import numpy as _np
+
+__all__ = ['free_energy_histogram']
+
+# binning a block needs a private nbins x nbins buffer, so blocks must be
+# large enough to amortize its reduction, and their buffers must stay small
+DEF MIN_BLOCK_SIZE = 65536
+DEF MAX_BUFFER_SIZE = 8388608
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def free_energy_histogram(
+        const double[::1] x, const double[::1] y, const double[::1] w,
+        int nbins, double xmin, double xmax, double ymin, double ymax,
+        double kT=1.0, bint minener_zero=False, bint avoid_zero_count=False):
+    r"""
+    Compute free energies from a uniform two-dimensional histogram.
+
+    Binning, normalization and the logarithm are fused into a single pass
+    over the samples and a single pass over the bins. Both passes run in
+    parallel if OpenMP is available: blocks of samples are binned into
+    private buffers, which are summed up afterwards.
+
+    Parameters
+    ----------
+    x : numpy.ndarray(shape=(T,), dtype=numpy.float64)
+        Sample x-coordinates.
+    y : numpy.ndarray(shape=(T,), dtype=numpy.float64)
+        Sample y-coordinates.
+    w : numpy.ndarray(shape=(T,), dtype=numpy.float64) or None
+        Sample weights; None gives all samples the same weight.
+    nbins : int
+        Number of histogram bins used in each dimension.
+    xmin, xmax : float
+        Range of the x-bins; samples outside are ignored.
+    ymin, ymax : float
+        Range of the y-bins; samples outside are ignored.
+    kT : float, optional, default=1.0
+        The value of kT in the desired energy unit.
+    minener_zero : bool, optional, default=False
+        Shifts the energy minimum to zero.
+    avoid_zero_count : bool, optional, default=False
+        Lift all histogram elements to the minimum nonzero value.
+
+    Returns
+    -------
+    free_energy : numpy.ndarray(shape=(nbins, nbins), dtype=numpy.float32)
+        The free energies in meshgrid format, i.e., free_energy[j, i] belongs
+        to the i'th x-bin and the j'th y-bin.
+    """
+    cdef:
+        Py_ssize_t b, j, k, t, ix, iy, nblocks, blocksize
+        Py_ssize_t nsamples = x.shape[0]
+        Py_ssize_t nbins2 = <Py_ssize_t> nbins * nbins
+        double sx = nbins / (xmax - xmin)
+        double sy = nbins / (ymax - ymin)
+        double weight, count, total = 0.0, zmax = 0.0, zmin = INFINITY, offset
+        double[:, ::1] partial
+        double[::1] z
+        float[::1] f
+        bint weighted = w is not None
+    if y.shape[0] != nsamples or (w is not None and w.shape[0] != nsamples):
+        raise ValueError("Unmatching number of samples")
+    nblocks = min(
+        _os.cpu_count() or 1,
+        nsamples // MIN_BLOCK_SIZE,
+        MAX_BUFFER_SIZE // nbins2)
+    nblocks = max(nblocks, 1)
+    blocksize = (nsamples + nblocks - 1) // nblocks
+    partial = _np.zeros(shape=(nblocks, nbins2), dtype=_np.float64)
+    z = partial[0]
+    free_energy = _np.empty(shape=(nbins, nbins), dtype=_np.float32)
+    f = free_energy.reshape((nbins2,))
+    with nogil:
+        for b in prange(nblocks, schedule='static'):
+            for t in range(b * blocksize, min((b + 1) * blocksize, nsamples)):
+                if not (xmin <= x[t] <= xmax and ymin <= y[t] <= ymax):
+                    continue
+                ix = <Py_ssize_t> ((x[t] - xmin) * sx)
+                iy = <Py_ssize_t> ((y[t] - ymin) * sy)
+                # samples on the upper edge belong to the last bin
+                if ix == nbins:
+                    ix = nbins - 1
+                if iy == nbins:
+                    iy = nbins - 1
+                weight = w[t] if weighted else 1.0
+                partial[b, iy * nbins + ix] += weight
+        if nblocks > 1:
+            for k in prange(nbins2, schedule='static'):
+                count = 0.0
+                for j in range(nblocks):
+                    count = count + partial[j, k]
+                z[k] = count
+        for k in range(nbins2):
+            if z[k] > 0.0 and z[k] < zmin:
+                zmin = z[k]
+        if avoid_zero_count and zmin < INFINITY:
+            for k in range(nbins2):
+                if z[k] < zmin:
+                    z[k] = zmin
+        for k in range(nbins2):
+            total += z[k]
+            if z[k] > zmax:
+                zmax = z[k]
+        # -log(z / total) = log(total) - log(z), and the energy minimum
+        # is found at the largest count
+        offset = _libc_log(zmax if minener_zero else total)
+        for k in prange(nbins2, schedule='static'):
+            if z[k] > 0.0:
+                f[k] = <float> (kT * (offset - _libc_log(z[k])))
+            else:
+                f[k] = INFINITY
+    return free_energy
@@ -19,21 +19,32 @@
 
 
 import numpy as _np
+import weakref as _weakref
 from warnings import warn as _warn
 
+try:
+    from fast_histogram import histogram2d as _fast_histogram2d
+except ImportError:
+    _fast_histogram2d = None
+
 __author__ = 'noe'
 
-_matplotlib_version = None
+_matplotlib_ge_2 = None
+# the last triangulation and weak references to the arrays holding its samples
+_triangulation = None
+# number of samples binned at once; keeps the index temporaries cache-sized
+_histogram_chunksize = 1 << 18
 
 
 def _get_cmap(cmap):
     # matplotlib 2.0 deprecated 'spectral' colormap, renamed to nipy_spectral.
-    global _matplotlib_version
-    if _matplotlib_version is None:
+    global _matplotlib_ge_2
+    if cmap != 'spectral':
+        return cmap
+    if _matplotlib_ge_2 is None:
         from matplotlib import __version__
-        from distutils.version import LooseVersion
-        _matplotlib_version = LooseVersion(__version__).version
-    if cmap == 'spectral' and _matplotlib_version >= (2, ):
+        _matplotlib_ge_2 = int(__version__.split('.')[0]) >= 2
+    if _matplotlib_ge_2:
         cmap = 'nipy_spectral'
     return cmap
 
@@ -67,7 +78,7 @@ def contour(
 
 def scatter_contour(
         x, y, z, ncontours=50, colorbar=True, fig=None,
-        ax=None, cmap=None, outfile=None):
+        ax=None, cmap=None, outfile=None, max_points=10000):
     """Contour plot on scattered data (x,y,z) and
     plots the positions of the points (x,y) on top.
 
@@ -92,6 +103,9 @@ def scatter_contour(
     outfile : str, optional, default=None
         output file to write the figure to. When not given,
         the plot will be displayed
+    max_points : int, optional, default=10000
+        maximum number of scattered points; larger data sets are
+        randomly subsampled. Use None to scatter all points.
 
     Returns
     -------
@@ -106,7 +120,12 @@ def scatter_contour(
         x, y, z, ncontours=ncontours, colorbar=colorbar,
         fig=fig, ax=ax, cmap=cmap)
     # scatter points
-    ax.scatter(x , y, marker='o', c='b', s=5)
+    if max_points is not None and len(x) > max_points:
+        # Generator.choice draws without permuting the whole population
+        idx = _np.sort(_np.random.default_rng(0).choice(
+            len(x), size=max_points, replace=False))
+        x, y = _np.asarray(x)[idx], _np.asarray(y)[idx]
+    ax.scatter(x , y, marker='o', c='b', s=5, rasterized=True)
     # show or save
     if outfile is not None:
         ax.get_figure().savefig(outfile)
@@ -120,9 +139,174 @@ def scatter_contour(
 # ######################################################################
 
 
+def _get_bin_range(xall, xrange=None):
+    """Find the range of uniform bins spanning all samples.
+
+    Parameters
+    ----------
+    xall : ndarray(T)
+        Sample coordinates.
+    xrange : (float, float), optional, default=None
+        Requested range; skips the search for the samples' range.
+
+    Returns
+    -------
+    xmin : float
+        The lower edge of the first bin.
+    xmax : float
+        The upper edge of the last bin.
+
+    Raises
+    ------
+    ValueError
+        If the range is not finite or its edges are in wrong order.
+
+    """
+    if xrange is None:
+        xmin, xmax = xall.min(), xall.max()
+        if not (_np.isfinite(xmin) and _np.isfinite(xmax)):
+            # same error as numpy.histogram for non-finite samples
+            raise ValueError(
+                'autodetected range of [{}, {}] is not finite'.format(
+                    xmin, xmax))
+    else:
+        xmin, xmax = xrange
+        if xmin > xmax:
+            raise ValueError(
+                'max must be larger than min in range parameter')
+        if not (_np.isfinite(xmin) and _np.isfinite(xmax)):
+            raise ValueError(
+                'supplied range of [{}, {}] is not finite'.format(
+                    xmin, xmax))
+    if xmin == xmax:
+        # same convention as numpy.histogram for an empty range
+        xmin, xmax = xmin - 0.5, xmax + 0.5
+    return float(xmin), float(xmax)
+
+
+def _get_bin_indices(xall, nbins, xmin, xmax):
+    """Assign samples to uniform bins.
+
+    Parameters
+    ----------
+    xall : ndarray(T)
+        Sample coordinates.
+    nbins : int
+        Number of bins.
+    xmin : float
+        The lower edge of the first bin.
+    xmax : float
+        The upper edge of the last bin.
+
+    Returns
+    -------
+    idx : ndarray(T, dtype=int)
+        The samples' bin indices.
+
+    """
+    idx = ((xall - xmin) * (nbins / (xmax - xmin))).astype(_np.intp)
+    # samples on the upper edge belong to the last bin
+    _np.minimum(idx, nbins - 1, out=idx)
+    return idx
+
+
+def _is_inside(xall, yall, xmin, xmax, ymin, ymax):
+    """Find samples inside the histogram range.
+
+    Parameters
+    ----------
+    xall : ndarray(T)
+        Sample x-coordinates.
+    yall : ndarray(T)
+        Sample y-coordinates.
+    xmin, xmax : float
+        The range of the x-bins.
+    ymin, ymax : float
+        The range of the y-bins.
+
+    Returns
+    -------
+    inside : ndarray(T, dtype=bool)
+        True for samples inside the histogram range.
+
+    """
+    return (xmin <= xall) & (xall <= xmax) & (ymin <= yall) & (yall <= ymax)
+
+
+def _get_bin_centers(nbins, xmin, xmax):
+    """Compute the centers of uniform bins.
+
+    Parameters
+    ----------
+    nbins : int
+        Number of bins.
+    xmin : float
+        The lower edge of the first bin.
+    xmax : float
+        The upper edge of the last bin.
+
+    Returns
+    -------
+    x : ndarray(nbins)
+        The bin centers.
+
+    """
+    edges = _np.linspace(xmin, xmax, nbins + 1)
+    return 0.5 * (edges[:-1] + edges[1:])
+
+
+def _bincount_histogram(
+        xall, yall, weights, nbins, xmin, xmax, ymin, ymax, clip):
+    """Histogram samples chunk by chunk with bincount.
+
+    Parameters
+    ----------
+    xall : ndarray(T)
+        Sample x-coordinates.
+    yall : ndarray(T)
+        Sample y-coordinates.
+    weights : ndarray(T) or None
+        Sample weights; None gives all samples the same weight.
+    nbins : int
+        Number of histogram bins used in each dimension.
+    xmin, xmax : float
+        The range of the x-bins.
+    ymin, ymax : float
+        The range of the y-bins.
+    clip : bool
+        Drop samples outside the histogram range.
+
+    Returns
+    -------
+    z : ndarray(nbins, nbins)
+        Histogram counts in meshgrid format.
+
+    """
+    z = _np.zeros(nbins * nbins, dtype=_np.intp if weights is None else None)
+    for start in range(0, len(xall), _histogram_chunksize):
+        chunk = slice(start, start + _histogram_chunksize)
+        xchunk, ychunk = xall[chunk], yall[chunk]
+        wchunk = None if weights is None else weights[chunk]
+        if clip:
+            # drop outside samples first; far outliers overflow the index cast
+            inside = _is_inside(xchunk, ychunk, xmin, xmax, ymin, ymax)
+            xchunk, ychunk = xchunk[inside], ychunk[inside]
+            if wchunk is not None:
+                wchunk = wchunk[inside]
+        ix = _get_bin_indices(xchunk, nbins, xmin, xmax)
+        iy = _get_bin_indices(ychunk, nbins, ymin, ymax)
+        # bin the transposed flat index to get z in x/y-directions directly;
+        # build it in place of iy to save a temporary per chunk
+        k = iy
+        k *= nbins
+        k += ix
+        z += _np.bincount(k, weights=wchunk, minlength=nbins * nbins)
+    return z.reshape(nbins, nbins)
+
+
 def get_histogram(
         xall, yall, nbins=100,
-        weights=None, avoid_zero_count=False):
+        weights=None, avoid_zero_count=False, range=None):
     """Compute a two-dimensional histogram.
 
     Parameters
@@ -139,6 +323,9 @@ def get_histogram(
         Avoid zero counts by lifting all histogram elements to the
         minimum value before computing the free energy. If False,
         zero histogram counts would yield infinity in the free energy.
+    range : array_like, shape(2, 2), optional, default=None
+        The histogram range [[xmin, xmax], [ymin, ymax]]; samples
+        outside are ignored. By default, the samples' ranges are used.
 
     Returns
     -------
@@ -146,17 +333,108 @@ def get_histogram(
         The bins' x-coordinates in meshgrid format.
     y : ndarray(nbins, nbins)
         The bins' y-coordinates in meshgrid format.
-    z : ndarray(nbins, nbins)
+    z : ndarray(nbins, nbins, dtype=float32)
         Histogram counts in meshgrid format.
 
+    Notes
+    -----
+    If the optional fast_histogram package is installed, it is used
+    to compute histograms with float or no weights.
+
     """
-    z, xedge, yedge = _np.histogram2d(
-        xall, yall, bins=nbins, weights=weights)
-    x = 0.5 * (xedge[:-1] + xedge[1:])
-    y = 0.5 * (yedge[:-1] + yedge[1:])
+    xall, yall = _np.asarray(xall), _np.asarray(yall)
+    xrange, yrange = (None, None) if range is None else range
+    xmin, xmax = _get_bin_range(xall, xrange)
+    ymin, ymax = _get_bin_range(yall, yrange)
+    if weights is not None:
+        weights = _np.asarray(weights)
+    if _fast_histogram2d is not None and (
+            weights is None or weights.dtype.kind == 'f'):
+        # swap x/y to get z in x/y-directions directly
+        z = _fast_histogram2d(
+            yall, xall, bins=nbins,
+            range=[[ymin, ymax], [xmin, xmax]], weights=weights)
+        # fast_histogram ignores samples on the upper edges
+        edge = _np.flatnonzero((xall == xmax) | (yall == ymax))
+        if range is not None:
+            edge = edge[_is_inside(
+                xall[edge], yall[edge], xmin, xmax, ymin, ymax)]
+        if edge.size > 0:
+            _np.add.at(
+                z, (_get_bin_indices(yall[edge], nbins, ymin, ymax),
+                    _get_bin_indices(xall[edge], nbins, xmin, xmax)),
+                1.0 if weights is None else weights[edge])
+    else:
+        z = _bincount_histogram(
+            xall, yall, weights, nbins, xmin, xmax, ymin, ymax,
+            range is not None)
+    # single precision suffices for plotting and halves the memory
+    # traffic of all subsequent operations on z
+    z = z.astype(_np.float32, copy=False)
+    x = _get_bin_centers(nbins, xmin, xmax)
+    y = _get_bin_centers(nbins, ymin, ymax)
     if avoid_zero_count:
-        z = _np.maximum(z, _np.min(z[z.nonzero()]))
-    return x, y, z.T # transpose to match x/y-directions
+        # lift to the smallest nonzero count without a masked copy of z;
+        # an empty histogram has no such count and stays as it is
+        zmin = z.min(where=z > 0, initial=_np.inf)
+        if zmin < _np.inf:
+            _np.maximum(z, zmin, out=z)
+    return x, y, z
+
+
+def _get_samples_owner(xall):
+    """Find the array which owns the memory of a sample array or view."""
+    while isinstance(xall.base, _np.ndarray):
+        xall = xall.base
+    return xall
+
+
+def _drop_triangulation(ref):
+    """Release the cached triangulation once its samples are freed."""
+    global _triangulation
+    if _triangulation is not None and any(
+            ref is owner for owner in _triangulation[1]):
+        _triangulation = None
+
+
+def _get_triangulation(xall, yall):
+    """Compute the Delaunay triangulation of two-dimensional samples.
+
+    The last triangulation is cached and reused as long as the
+    samples do not change, e.g., when interpolating different
+    z-data over the same x/y-samples. The cache only lives as long
+    as the arrays owning the samples.
+
+    Parameters
+    ----------
+    xall : ndarray(T)
+        Sample x-coordinates.
+    yall : ndarray(T)
+        Sample y-coordinates.
+
+    Returns
+    -------
+    triangulation : scipy.spatial.Delaunay object
+        The triangulation of the samples.
+
+    """
+    global _triangulation
+    xall, yall = _np.asarray(xall), _np.asarray(yall)
+    if _triangulation is not None:
+        triangulation, _ = _triangulation
+        points = triangulation.points
+        # compare column by column to avoid stacking the samples
+        if points.shape == (xall.shape[0], 2) \
+                and _np.array_equal(points[:, 0], xall) \
+                and _np.array_equal(points[:, 1], yall):
+            return triangulation
+    from scipy.spatial import Delaunay
+    triangulation = Delaunay(
+        _np.column_stack([xall, yall]).astype(_np.float64, copy=False))
+    _triangulation = triangulation, tuple(
+        _weakref.ref(_get_samples_owner(samples), _drop_triangulation)
+        for samples in (xall, yall))
+    return triangulation
 
 
 def get_grid_data(xall, yall, zall, nbins=100, method='nearest'):
@@ -173,27 +451,53 @@ def get_grid_data(xall, yall, zall, nbins=100, method='nearest'):
     nbins : int, optional, default=100
         Number of histogram bins used in x/y-dimensions.
     method : str, optional, default='nearest'
-        Assignment method; scipy.interpolate.griddata supports the
-        methods 'nearest', 'linear', and 'cubic'.
+        Assignment method; 'nearest' (KD-tree lookup), 'linear', or
+        'cubic' (interpolation on a Delaunay triangulation).
 
     Returns
     -------
     x : ndarray(nbins, nbins)
-        The bins' x-coordinates in meshgrid format.
+        The bins' x-coordinates in meshgrid format; a read-only view.
     y : ndarray(nbins, nbins)
-        The bins' y-coordinates in meshgrid format.
+        The bins' y-coordinates in meshgrid format; a read-only view.
     z : ndarray(nbins, nbins)
         Interpolated z-data in meshgrid format.
 
+    Raises
+    ------
+    ValueError
+        If method is unknown.
+
     """
-    from scipy.interpolate import griddata
-    x, y = _np.meshgrid(
-        _np.linspace(xall.min(), xall.max(), nbins),
-        _np.linspace(yall.min(), yall.max(), nbins),
-        indexing='ij')
-    z = griddata(
-        _np.hstack([xall[:,None], yall[:,None]]),
-        zall, (x, y), method=method)
+    xs = _np.linspace(xall.min(), xall.max(), nbins)
+    ys = _np.linspace(yall.min(), yall.max(), nbins)
+    # broadcast views share the axes instead of materializing a meshgrid
+    x = _np.broadcast_to(xs[:, None], (nbins, nbins))
+    y = _np.broadcast_to(ys[None, :], (nbins, nbins))
+    if method == 'nearest':
+        # a direct KD-tree query avoids building an interpolator
+        from scipy.spatial import cKDTree
+        tree = cKDTree(_np.column_stack([xall, yall]))
+        points = _np.empty((nbins * nbins, 2))
+        points[:, 0] = _np.repeat(xs, nbins)
+        points[:, 1] = _np.tile(ys, nbins)
+        try:
+            _, idx = tree.query(points, workers=-1)
+        except TypeError:
+            # scipy < 1.6 names the parallelism argument n_jobs
+            _, idx = tree.query(points, n_jobs=-1)
+        z = _np.asarray(zall)[idx].reshape(nbins, nbins)
+    elif method in ('linear', 'cubic'):
+        from scipy.interpolate import (
+            LinearNDInterpolator, CloughTocher2DInterpolator)
+        interpolator = {
+            'linear': LinearNDInterpolator,
+            'cubic': CloughTocher2DInterpolator}[method]
+        z = interpolator(
+            _get_triangulation(xall, yall), zall)(xs[:, None], ys[None, :])
+    else:
+        raise ValueError(
+            'Unknown interpolation method {}'.format(method))
     return x, y, z
 
 
@@ -206,10 +510,10 @@ def _to_density(z):
         Histogram counts.
 
     """
-    return z / float(z.sum())
+    return z / float(z.sum(dtype=_np.float64))
 
 
-def _to_free_energy(z, minener_zero=False):
+def _to_free_energy(z, minener_zero=False, kT=1.0):
     """Compute free energies from histogram counts.
 
     Parameters
@@ -218,22 +522,96 @@ def _to_free_energy(z, minener_zero=False):
         Histogram counts.
     minener_zero : boolean, optional, default=False
         Shifts the energy minimum to zero.
+    kT : float, optional, default=1.0
+        The value of kT in the desired energy unit.
 
     Returns
     -------
     free_energy : ndarray(T)
-        The free energy values in units of kT.
+        The free energy values in the energy unit of kT.
 
     """
-    pi = _to_density(z)
-    free_energy = _np.inf * _np.ones(shape=z.shape)
-    nonzero = pi.nonzero()
-    free_energy[nonzero] = -_np.log(pi[nonzero])
-    if minener_zero:
-        free_energy[nonzero] -= _np.min(free_energy[nonzero])
+    nonzero = z > 0
+    # keep single precision histograms in single precision and match the
+    # memory layout of z so that the ufunc loops below run contiguously
+    free_energy = _np.full_like(
+        z, _np.inf, dtype=_np.result_type(z.dtype, _np.float32))
+    _np.log(z, out=free_energy, where=nonzero)
+    # -log(z / z.sum()) = log(z.sum()) - log(z), and the energy
+    # minimum is found at the largest count
+    with _np.errstate(divide='ignore'):
+        offset = float(_np.log(
+            z.max() if minener_zero else z.sum(dtype=_np.float64)))
+    _np.subtract(offset, free_energy, out=free_energy, where=nonzero)
+    if kT != 1.0:
+        free_energy *= kT
     return free_energy
 
 
+def _get_free_energy(
+        xall, yall, nbins=100, weights=None, avoid_zero_count=False,
+        minener_zero=False, kT=1.0, range=None):
+    """Compute free energies from a two-dimensional histogram.
+
+    This is equivalent to get_histogram() followed by _to_free_energy()
+    but uses a fused compiled kernel if available.
+
+    Parameters
+    ----------
+    xall : ndarray(T)
+        Sample x-coordinates.
+    yall : ndarray(T)
+        Sample y-coordinates.
+    nbins : int, optional, default=100
+        Number of histogram bins used in each dimension.
+    weights : ndarray(T), optional, default=None
+        Sample weights; by default all samples have the same weight.
+    avoid_zero_count : bool, optional, default=False
+        Avoid zero counts by lifting all histogram elements to the
+        minimum value before computing the free energy.
+    minener_zero : boolean, optional, default=False
+        Shifts the energy minimum to zero.
+    kT : float, optional, default=1.0
+        The value of kT in the desired energy unit.
+    range : array_like, shape(2, 2), optional, default=None
+        The histogram range [[xmin, xmax], [ymin, ymax]]; samples
+        outside are ignored. By default, the samples' ranges are used.
+
+    Returns
+    -------
+    x : ndarray(nbins, nbins)
+        The bins' x-coordinates in meshgrid format.
+    y : ndarray(nbins, nbins)
+        The bins' y-coordinates in meshgrid format.
+    free_energy : ndarray(nbins, nbins, dtype=float32)
+        The free energy values in meshgrid format.
+
+    """
+    try:
+        from ._ext.histogram import free_energy_histogram
+    except ImportError:
+        x, y, z = get_histogram(
+            xall, yall, nbins=nbins, weights=weights,
+            avoid_zero_count=avoid_zero_count, range=range)
+        return x, y, _to_free_energy(
+            z, minener_zero=minener_zero, kT=kT)
+    xall = _np.ascontiguousarray(xall, dtype=_np.float64)
+    yall = _np.ascontiguousarray(yall, dtype=_np.float64)
+    if weights is not None:
+        weights = _np.ascontiguousarray(weights, dtype=_np.float64)
+    xrange, yrange = (None, None) if range is None else range
+    xmin, xmax = _get_bin_range(xall, xrange)
+    ymin, ymax = _get_bin_range(yall, yrange)
+    free_energy = free_energy_histogram(
+        xall, yall, weights, nbins, xmin, xmax, ymin, ymax,
+        kT=kT, minener_zero=minener_zero,
+        avoid_zero_count=bool(avoid_zero_count))
+    return (
+        _get_bin_centers(nbins, xmin, xmax),
+        _get_bin_centers(nbins, ymin, ymax),
+        free_energy)
+
+
 def _prune_kwargs(kwargs):
     """Remove non-allowed keys from a kwargs dictionary.
 
@@ -276,7 +654,7 @@ def plot_map(
     cmap : matplotlib colormap, optional, default=None
         The color map to use.
     ncontours : int, optional, default=100
-        Number of contour levels.
+        Number of contour levels; ignored if levels are given.
     vmin : float, optional, default=None
         Lowest z-value to be plotted.
     vmax : float, optional, default=None
@@ -361,10 +739,13 @@ def plot_map(
         fig, ax = _plt.subplots()
     else:
         fig = ax.get_figure()
-    mappable = ax.contourf(
-        x, y, z, ncontours, norm=norm,
-        vmin=vmin, vmax=vmax, cmap=cmap,
-        levels=levels, **_prune_kwargs(kwargs))
+    kwargs = _prune_kwargs(kwargs)
+    kwargs.update(norm=norm, vmin=vmin, vmax=vmax, cmap=cmap)
+    # given levels make ncontours obsolete; do not pass both
+    if levels is None:
+        mappable = ax.contourf(x, y, z, ncontours, **kwargs)
+    else:
+        mappable = ax.contourf(x, y, z, levels=levels, **kwargs)
     misc = dict(mappable=mappable)
     if cbar_orientation not in ('horizontal', 'vertical'):
         raise ValueError(
@@ -394,7 +775,7 @@ def plot_density(
         ncontours=100, vmin=None, vmax=None, levels=None,
         cbar=True, cax=None, cbar_label='sample density',
         cbar_orientation='vertical', logscale=False, nbins=100,
-        weights=None, avoid_zero_count=False, **kwargs):
+        weights=None, avoid_zero_count=False, range=None, **kwargs):
     """Plot a two-dimensional density map using a histogram of
     scattered data.
 
@@ -435,6 +816,9 @@ def plot_density(
         Avoid zero counts by lifting all histogram elements to the
         minimum value before computing the free energy. If False,
         zero histogram counts would yield infinity in the free energy.
+    range : array_like, shape(2, 2), optional, default=None
+        The histogram range [[xmin, xmax], [ymin, ymax]]; samples
+        outside are ignored. By default, the samples' ranges are used.
 
     Optional parameters for contourf (**kwargs)
     -------------------------------------------
@@ -499,7 +883,7 @@ def plot_density(
     """
     x, y, z = get_histogram(
         xall, yall, nbins=nbins, weights=weights,
-        avoid_zero_count=avoid_zero_count)
+        avoid_zero_count=avoid_zero_count, range=range)
     pi = _to_density(z)
     pi = _np.ma.masked_where(pi <= 0, pi)
     if logscale:
@@ -520,7 +904,7 @@ def plot_density(
         **kwargs)
     if cbar and logscale:
         from matplotlib.ticker import LogLocator
-        misc['cbar'].set_ticks(LogLocator(base=10.0, subs=range(10)))
+        misc['cbar'].set_ticks(LogLocator(base=10.0, subs=_np.arange(10)))
     return fig, ax, misc
 
 
@@ -530,7 +914,7 @@ def plot_free_energy(
         vmin=None, vmax=None, cmap='nipy_spectral', cbar=True,
         cbar_label='free energy / kT', cax=None, levels=None,
         legacy=True, ncountours=None, cbar_orientation='vertical',
-        **kwargs):
+        range=None, **kwargs):
     """Plot a two-dimensional free energy map using a histogram of
     scattered data.
 
@@ -585,6 +969,9 @@ def plot_free_energy(
         Legacy parameter (typo) for number of contour levels.
     cbar_orientation : str, optional, default='vertical'
         Colorbar orientation; choose 'vertical' or 'horizontal'.
+    range : array_like, shape(2, 2), optional, default=None
+        The histogram range [[xmin, xmax], [ymin, ymax]]; samples
+        outside are ignored. By default, the samples' ranges are used.
 
     Optional parameters for contourf (**kwargs)
     -------------------------------------------
@@ -673,10 +1060,10 @@ def plot_free_energy(
             raise ValueError(
                 'Parameter ncountours is not allowed outside'
                 ' legacy mode; use ncontours instead')
-    x, y, z = get_histogram(
+    x, y, f = _get_free_energy(
         xall, yall, nbins=nbins, weights=weights,
-        avoid_zero_count=avoid_zero_count)
-    f = _to_free_energy(z, minener_zero=minener_zero) * kT
+        avoid_zero_count=avoid_zero_count,
+        minener_zero=minener_zero, kT=kT, range=range)
     fig, ax, misc = plot_map(
         x, y, f, ax=ax, cmap=cmap,
         ncontours=ncontours, vmin=vmin, vmax=vmax, levels=levels,
@@ -732,8 +1119,8 @@ def plot_contour(
     nbins : int, optional, default=100
         Number of grid points used in each dimension.
     method : str, optional, default='nearest'
-        Assignment method; scipy.interpolate.griddata supports the
-        methods 'nearest', 'linear', and 'cubic'.
+        Assignment method; 'nearest' (KD-tree lookup), 'linear', or
+        'cubic' (interpolation on a Delaunay triangulation).
     mask : boolean, optional, default=False
         Hide unsampled areas if True.
 
@@ -797,6 +1184,11 @@ def plot_contour(
         Contains a matplotlib.contour.QuadContourSet 'mappable' and,
         if requested, a matplotlib.Colorbar object 'cbar'.
 
+    Raises
+    ------
+    ValueError
+        If method is unknown.
+
     """
     x, y, z = get_grid_data(
         xall, yall, zall, nbins=nbins, method=method)
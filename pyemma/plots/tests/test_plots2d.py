@@ -17,14 +17,19 @@
 
 
 import unittest
+import warnings
+from unittest import mock
 import numpy as np
 import matplotlib.pyplot as plt
 
+import pyemma.plots.plots2d as plots2d
 from pyemma.plots.plots2d import contour, scatter_contour
 from pyemma.plots.plots2d import plot_density
 from pyemma.plots.plots2d import plot_free_energy
 from pyemma.plots.plots2d import plot_contour
 from pyemma.plots.plots2d import plot_state_map
+from pyemma.plots.plots2d import get_histogram
+from pyemma.plots.plots2d import _get_free_energy
 
 
 class TestPlots2d(unittest.TestCase):
@@ -37,6 +42,118 @@ class TestPlots2d(unittest.TestCase):
             self.data[:, 0], self.data[:, 1])
         plt.close(fig)
 
+    @staticmethod
+    def _histogram_backends():
+        # the bincount fallback bins in small chunks to cover the chunk loop
+        backends = [('bincount', dict(_fast_histogram2d=None, _histogram_chunksize=128))]
+        if plots2d._fast_histogram2d is not None:
+            backends.append(('fast_histogram', dict(_fast_histogram2d=plots2d._fast_histogram2d)))
+        return backends
+
+    def _assert_histogram(self, xall, yall, nbins, weights=None, hist_range=None):
+        z_ref, xedge, yedge = np.histogram2d(
+            xall, yall, bins=nbins, weights=weights, range=hist_range)
+        for name, patches in self._histogram_backends():
+            with self.subTest(backend=name), \
+                    mock.patch.multiple(plots2d, **patches):
+                x, y, z = get_histogram(
+                    xall, yall, nbins=nbins, weights=weights, range=hist_range)
+                np.testing.assert_allclose(x, 0.5 * (xedge[:-1] + xedge[1:]))
+                np.testing.assert_allclose(y, 0.5 * (yedge[:-1] + yedge[1:]))
+                np.testing.assert_allclose(z, z_ref.T, rtol=1e-5)
+
+    def test_get_histogram(self):
+        xall, yall = np.random.randn(2, 1000)
+        for weights in (None, np.random.rand(1000)):
+            self._assert_histogram(xall, yall, 20, weights=weights)
+
+    def test_get_histogram_edges(self):
+        # integer samples land exactly on the bin edges, including the upper ones
+        xall, yall = np.random.randint(0, 11, size=(2, 1000)).astype(np.float64)
+        for weights in (None, np.random.rand(1000)):
+            for hist_range in (None, [[2.0, 8.0], [1.0, 9.0]]):
+                self._assert_histogram(
+                    xall, yall, 10, weights=weights, hist_range=hist_range)
+
+    def test_get_histogram_range(self):
+        xall, yall = np.random.randn(2, 1000)
+        hist_range = [[-1.0, 1.5], [-0.5, 1.0]]
+        for weights in (None, np.random.rand(1000)):
+            self._assert_histogram(
+                xall, yall, 20, weights=weights, hist_range=hist_range)
+        with self.assertRaises(ValueError):
+            get_histogram(xall, yall, range=[[1.0, -1.0], [-1.0, 1.0]])
+
+    def test_get_histogram_range_outlier(self):
+        xall, yall = np.random.rand(2, 1000)
+        xall[0] = 1e30
+        with mock.patch.object(plots2d, '_fast_histogram2d', None):
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                _, _, z = get_histogram(
+                    xall, yall, nbins=20, range=[[0.0, 1.0], [0.0, 1.0]])
+        self.assertEqual(z.sum(), 999)
+
+    def test_get_free_energy(self):
+        try:
+            from pyemma.plots._ext.histogram import free_energy_histogram
+        except ImportError:
+            self.skipTest('free energy histogram extension is not built')
+        xall, yall = np.random.randn(2, 1000)
+        weights = np.random.rand(1000)
+        for hist_range in (None, [[-1.0, 1.5], [-0.5, 1.0]]):
+            z_ref, xedge, yedge = np.histogram2d(
+                xall, yall, bins=20, weights=weights, range=hist_range)
+            for avoid_zero_count in (False, True):
+                z = z_ref.T
+                if avoid_zero_count:
+                    z = np.maximum(z, z[z > 0].min())
+                with np.errstate(divide='ignore'):
+                    f_ref = -2.0 * np.log(z / z.max())
+                x, y, f = _get_free_energy(
+                    xall, yall, nbins=20, weights=weights,
+                    avoid_zero_count=avoid_zero_count, minener_zero=True,
+                    kT=2.0, range=hist_range)
+                np.testing.assert_allclose(x, 0.5 * (xedge[:-1] + xedge[1:]))
+                np.testing.assert_allclose(y, 0.5 * (yedge[:-1] + yedge[1:]))
+                self.assertEqual(f.dtype, np.float32)
+                np.testing.assert_allclose(f, f_ref, rtol=1e-5, atol=1e-5)
+
+    def test_get_free_energy_empty_histogram(self):
+        xall, yall = np.random.rand(2, 1000)
+        for weights, hist_range in (
+                (None, [[2.0, 3.0], [2.0, 3.0]]), (np.zeros(1000), None)):
+            _, _, z = get_histogram(
+                xall, yall, nbins=20, weights=weights,
+                avoid_zero_count=True, range=hist_range)
+            np.testing.assert_array_equal(z, 0.0)
+            _, _, f = _get_free_energy(
+                xall, yall, nbins=20, weights=weights,
+                avoid_zero_count=True, range=hist_range)
+            self.assertTrue(np.all(np.isposinf(f)))
+
+    def test_get_free_energy_non_finite_samples(self):
+        for value in (np.nan, np.inf):
+            xall, yall = np.random.rand(2, 1000)
+            xall[42] = value
+            with self.assertRaisesRegex(ValueError, 'range of .* is not finite'):
+                get_histogram(xall, yall, nbins=20)
+            with self.assertRaisesRegex(ValueError, 'range of .* is not finite'):
+                _get_free_energy(xall, yall, nbins=20)
+            with self.assertRaisesRegex(ValueError, 'range of .* is not finite'):
+                plot_free_energy(xall, yall, nbins=20)
+
+    def test_triangulation_cache(self):
+        data = np.random.rand(100, 2)
+        triangulation = plots2d._get_triangulation(data[:, 0], data[:, 1])
+        self.assertIs(
+            plots2d._get_triangulation(data[:, 0], data[:, 1]), triangulation)
+        data[0, 0] += 1.0
+        self.assertIsNot(
+            plots2d._get_triangulation(data[:, 0], data[:, 1]), triangulation)
+        del data
+        self.assertIsNone(plots2d._triangulation)
+
     def test_contour(self):
         ax = contour(self.data[:,0], self.data[:,1], self.data[:,0])
         plt.close(ax.get_figure())
@@ -50,6 +167,14 @@ class TestPlots2d(unittest.TestCase):
             self.data[:,0], self.data[:,1], self.data[:,0])
         plt.close(ax.get_figure())
 
+    def test_scatter_contour_max_points(self):
+        for max_points, npoints in ((30, 30), (None, 100)):
+            ax = scatter_contour(
+                self.data[:,0], self.data[:,1], self.data[:,0],
+                max_points=max_points)
+            self.assertEqual(len(ax.collections[-1].get_offsets()), npoints)
+            plt.close(ax.get_figure())
+
     def test_plot_density(self):
         fig, ax, misc = plot_density(
             self.data[:, 0], self.data[:, 1], logscale=True)
@@ -17,6 +17,11 @@
 
 import numpy as _np
 from pyemma.util import types as _types
+from pyemma._base.progress import ProgressReporter as _ProgressReporter
+from .estimators import DTRAM as _DTRAM
+from .estimators import MBAR as _MBAR
+from .estimators import TRAM as _TRAM
+from .estimators import WHAM as _WHAM
 from .util import get_averaged_bias_matrix as _get_averaged_bias_matrix
 from .util import assign_unbiased_state_label as _assign_unbiased_state_label
 
@@ -234,27 +239,28 @@ def estimate_umbrella_sampling(
     # data preparation
     ttrajs, btrajs, umbrella_centers, force_constants, unbiased_state = _get_umbrella_sampling_data(
         us_trajs, us_centers, us_force_constants, md_trajs=md_trajs, kT=kT, width=width)
+    dtrajs = us_dtrajs + md_dtrajs
+    if estimator in ('wham', 'dtram'):
+        bias = _get_averaged_bias_matrix(btrajs, dtrajs)
     estimator_obj = None
     # estimation
     if estimator == 'wham':
         estimator_obj = wham(
-            ttrajs, us_dtrajs + md_dtrajs,
-            _get_averaged_bias_matrix(btrajs, us_dtrajs + md_dtrajs),
+            ttrajs, dtrajs, bias,
             maxiter=maxiter, maxerr=maxerr,
             save_convergence_info=save_convergence_info, dt_traj=dt_traj)
     elif estimator == 'mbar':
         allowed_keys = ['direct_space']
         parsed_kwargs = dict([(i, kwargs[i]) for i in allowed_keys if i in kwargs])
         estimator_obj = mbar(
-            ttrajs, us_dtrajs + md_dtrajs, btrajs,
+            ttrajs, dtrajs, btrajs,
             maxiter=maxiter, maxerr=maxerr, save_convergence_info=save_convergence_info,
             dt_traj=dt_traj, **parsed_kwargs)
     elif estimator == 'dtram':
         allowed_keys = ['count_mode', 'connectivity']
         parsed_kwargs = dict([(i, kwargs[i]) for i in allowed_keys if i in kwargs])
         estimator_obj = dtram(
-            ttrajs, us_dtrajs + md_dtrajs,
-            _get_averaged_bias_matrix(btrajs, us_dtrajs + md_dtrajs),
+            ttrajs, dtrajs, bias,
             lag, unbiased_state=unbiased_state,
             maxiter=maxiter, maxerr=maxerr, save_convergence_info=save_convergence_info,
             dt_traj=dt_traj, init=init, init_maxiter=init_maxiter, init_maxerr=init_maxerr,
@@ -265,7 +271,7 @@ def estimate_umbrella_sampling(
             'direct_space', 'N_dtram_accelerations', 'equilibrium', 'overcounting_factor', 'callback']
         parsed_kwargs = dict([(i, kwargs[i]) for i in allowed_keys if i in kwargs])
         estimator_obj = tram(
-            ttrajs, us_dtrajs + md_dtrajs, btrajs, lag, unbiased_state=unbiased_state,
+            ttrajs, dtrajs, btrajs, lag, unbiased_state=unbiased_state,
             maxiter=maxiter, maxerr=maxerr, save_convergence_info=save_convergence_info,
             dt_traj=dt_traj, init=init, init_maxiter=init_maxiter, init_maxerr=init_maxerr,
             **parsed_kwargs)
@@ -461,6 +467,52 @@ def estimate_multi_temperature(
 # wrappers for the estimators
 # ==================================================================================================
 
+def _prepare_trajs(ttrajs, dtrajs, btrajs=None):
+    r"""
+    Ensure lists of thermodynamic and discrete trajectories with matching lengths.
+
+    Parameters
+    ----------
+    ttrajs : numpy.ndarray(T) of int, or list of numpy.ndarray(T_i) of int
+        A single thermodynamic state trajectory or a list of them.
+    dtrajs : numpy.ndarray(T) of int, or list of numpy.ndarray(T_i) of int
+        A single discrete trajectory or a list of them.
+    btrajs : list of numpy.ndarray(T_i, num_therm_states), optional, default=None
+        Reduced bias energy trajectories to check against ttrajs, too.
+
+    Returns
+    -------
+    ttrajs : list of numpy.ndarray(T_i, dtype=numpy.intc)
+        The thermodynamic state trajectories.
+    dtrajs : list of numpy.ndarray(T_i, dtype=numpy.intc)
+        The discrete trajectories.
+    """
+    ttrajs = _types.ensure_dtraj_list(ttrajs)
+    dtrajs = _types.ensure_dtraj_list(dtrajs)
+    if len(ttrajs) != len(dtrajs):
+        raise ValueError("Unmatching number of dtraj/ttraj elements: %d!=%d" % (
+            len(dtrajs), len(ttrajs)))
+    tlens = _np.fromiter(map(len, ttrajs), dtype=_np.intp, count=len(ttrajs))
+    dlens = _np.fromiter(map(len, dtrajs), dtype=_np.intp, count=len(dtrajs))
+    mismatch = _np.flatnonzero(tlens != dlens)
+    if mismatch.size > 0:
+        raise ValueError("Unmatching number of data points in ttraj/dtraj: %d!=%d" % (
+            tlens[mismatch[0]], dlens[mismatch[0]]))
+    if btrajs is not None:
+        if len(ttrajs) != len(btrajs):
+            raise ValueError("Unmatching number of ttraj/bias elements: %d!=%d" % (
+                len(ttrajs), len(btrajs)))
+        blens = _np.fromiter(
+            (btraj.shape[0] for btraj in btrajs), dtype=_np.intp, count=len(btrajs))
+        mismatch = _np.flatnonzero(tlens != blens)
+        if mismatch.size > 0:
+            raise ValueError("Unmatching number of data points in ttraj/bias trajectory: %d!=%d" % (
+                tlens[mismatch[0]], blens[mismatch[0]]))
+    # cast once here, so that the estimators for all lag times reuse the same arrays
+    ttrajs = [_np.require(t, dtype=_np.intc, requirements='C') for t in ttrajs]
+    dtrajs = [_np.require(d, dtype=_np.intc, requirements='C') for d in dtrajs]
+    return ttrajs, dtrajs
+
 def tram(
     ttrajs, dtrajs, bias, lag, unbiased_state=None,
     count_mode='sliding', connectivity='post_hoc_RE',
@@ -661,28 +713,12 @@ def tram(
 
     """
     # prepare trajectories
-    ttrajs = _types.ensure_dtraj_list(ttrajs)
-    dtrajs = _types.ensure_dtraj_list(dtrajs)
-    if len(ttrajs) != len(dtrajs):
-        raise ValueError("Unmatching number of dtraj/ttraj elements: %d!=%d" % (
-            len(dtrajs), len(ttrajs)))
-    if len(ttrajs) != len(bias):
-        raise ValueError("Unmatching number of ttraj/bias elements: %d!=%d" % (
-            len(ttrajs), len(bias)))
-    for ttraj, dtraj, btraj in zip(ttrajs, dtrajs, bias):
-        if len(ttraj) != len(dtraj):
-            raise ValueError("Unmatching number of data points in ttraj/dtraj: %d!=%d" % (
-                len(ttraj), len(dtraj)))
-        if len(ttraj) != btraj.shape[0]:
-            raise ValueError("Unmatching number of data points in ttraj/bias trajectory: %d!=%d" % (
-                len(ttraj), len(btraj)))
+    ttrajs, dtrajs = _prepare_trajs(ttrajs, dtrajs, btrajs=bias)
     # check lag time(s)
     lags = _np.asarray(lag, dtype=_np.intc).reshape((-1,)).tolist()
     # build TRAM and run estimation
-    from pyemma.thermo import TRAM as _TRAM
     tram_estimators = []
-    from pyemma._base.progress import ProgressReporter
-    pg = ProgressReporter()
+    pg = _ProgressReporter()
     pg.register(amount_of_work=len(lags), description='Estimating TRAM for lags')
     with pg.context():
         for lag in lags:
@@ -718,7 +754,9 @@ def dtram(
     dtrajs : numpy.ndarray(T) of int, or list of numpy.ndarray(T_i) of int
         A single discrete trajectory or a list of discrete trajectories. The integers are indexes
         in 0,...,num_conf_states-1 enumerating the num_conf_states Markov states or the bins the
-        trajectory is in at any time.
+        trajectory is in at any time. Trajectories that already are C-contiguous arrays of dtype
+        numpy.intc (for ttrajs, too) are used as they are, without a copy; other arrays are
+        converted once for all lag times.
     bias : numpy.ndarray(shape=(num_therm_states, num_conf_states)) object
         bias_energies_full[j, i] is the bias energy in units of kT for each discrete state i
         at thermodynamic state j.
@@ -873,26 +911,16 @@ def dtram(
 
     """
     # prepare trajectories
-    ttrajs = _types.ensure_dtraj_list(ttrajs)
-    dtrajs = _types.ensure_dtraj_list(dtrajs)
-    if len(ttrajs) != len(dtrajs):
-        raise ValueError("Unmatching number of dtraj/ttraj elements: %d!=%d" % (
-            len(dtrajs), len(ttrajs)) )
-    for ttraj, dtraj in zip(ttrajs, dtrajs):
-        if len(ttraj) != len(dtraj):
-            raise ValueError("Unmatching number of data points in ttraj/dtraj: %d!=%d" % (
-                len(ttraj), len(dtraj)))
+    ttrajs, dtrajs = _prepare_trajs(ttrajs, dtrajs)
     # check lag time(s)
     lags = _np.asarray(lag, dtype=_np.intc).reshape((-1,)).tolist()
     # build DTRAM and run estimation
-    from pyemma.thermo import DTRAM
-    from pyemma._base.progress import ProgressReporter
-    pg = ProgressReporter()
+    pg = _ProgressReporter()
     pg.register(len(lags), description='Estimating DTRAM for lags')
     dtram_estimators = []
     with pg.context():
         for _lag in lags:
-            d = DTRAM(
+            d = _DTRAM(
                 bias, _lag,
                 count_mode=count_mode, connectivity=connectivity,
                 maxiter=maxiter, maxerr=maxerr, save_convergence_info=save_convergence_info,
@@ -921,7 +949,9 @@ def wham(
     dtrajs : numpy.ndarray(T) of int, or list of numpy.ndarray(T_i) of int
         A single discrete trajectory or a list of discrete trajectories. The integers are indexes
         in 0,...,num_conf_states-1 enumerating the num_conf_states Markov states or the bins the
-        trajectory is in at any time.
+        trajectory is in at any time. Trajectories that already are C-contiguous arrays of dtype
+        numpy.intc (for ttrajs, too) are used as they are, without a copy; other arrays are
+        converted once.
     bias : numpy.ndarray(shape=(num_therm_states, num_conf_states)) object
         bias_energies_full[j, i] is the bias energy in units of kT for each discrete state i
         at thermodynamic state j.
@@ -1031,18 +1061,9 @@ def wham(
 
     """
     # check trajectories
-    ttrajs = _types.ensure_dtraj_list(ttrajs)
-    dtrajs = _types.ensure_dtraj_list(dtrajs)
-    if len(ttrajs) != len(dtrajs):
-        raise ValueError("Unmatching number of dtraj/ttraj elements: %d!=%d" % (
-            len(dtrajs), len(ttrajs)) )
-    for ttraj, dtraj in zip(ttrajs, dtrajs):
-        if len(ttraj) != len(dtraj):
-            raise ValueError("Unmatching number of data points in ttraj/dtraj: %d!=%d" % (
-                len(ttraj), len(dtraj)))
+    ttrajs, dtrajs = _prepare_trajs(ttrajs, dtrajs)
     # build WHAM
-    from pyemma.thermo import WHAM
-    wham_estimator = WHAM(
+    wham_estimator = _WHAM(
         bias,
         maxiter=maxiter, maxerr=maxerr,
         save_convergence_info=save_convergence_info, dt_traj=dt_traj)
@@ -1169,24 +1190,9 @@ def mbar(
 
     """
     # check trajectories
-    ttrajs = _types.ensure_dtraj_list(ttrajs)
-    dtrajs = _types.ensure_dtraj_list(dtrajs)
-    if len(ttrajs) != len(dtrajs):
-        raise ValueError("Unmatching number of dtraj/ttraj elements: %d!=%d" % (
-            len(dtrajs), len(ttrajs)))
-    if len(ttrajs) != len(bias):
-        raise ValueError("Unmatching number of ttraj/bias elements: %d!=%d" % (
-            len(ttrajs), len(bias)))
-    for ttraj, dtraj, btraj in zip(ttrajs, dtrajs, bias):
-        if len(ttraj) != len(dtraj):
-            raise ValueError("Unmatching number of data points in ttraj/dtraj: %d!=%d" % (
-                len(ttraj), len(dtraj)))
-        if len(ttraj) != btraj.shape[0]:
-            raise ValueError("Unmatching number of data points in ttraj/bias trajectory: %d!=%d" % (
-                len(ttraj), len(btraj)))
+    ttrajs, dtrajs = _prepare_trajs(ttrajs, dtrajs, btrajs=bias)
     # build MBAR
-    from pyemma.thermo import MBAR
-    mbar_estimator = MBAR(
+    mbar_estimator = _MBAR(
         maxiter=maxiter, maxerr=maxerr, save_convergence_info=save_convergence_info,
         dt_traj=dt_traj, direct_space=direct_space)
     # run estimation
@@ -208,7 +208,13 @@ class DTRAM(_Estimator, _MEMM, ThermoBase):
         for ttraj, dtraj in zip(ttrajs, dtrajs):
             _types.assert_array(ttraj, ndim=1, kind='numeric')
             _types.assert_array(dtraj, ndim=1, kind='numeric')
-            assert _np.shape(ttraj)[0] == _np.shape(dtraj)[0]
+        assert _np.array_equal(
+            _np.fromiter(map(len, ttrajs), dtype=_np.intp, count=len(ttrajs)),
+            _np.fromiter(map(len, dtrajs), dtype=_np.intp, count=len(dtrajs)))
+
+        # cast types once so that the counting passes below need no conversions
+        ttrajs = [_np.require(t, dtype=_np.intc, requirements='C') for t in ttrajs]
+        dtrajs = [_np.require(d, dtype=_np.intc, requirements='C') for d in dtrajs]
 
         # harvest transition counts
         self.count_matrices_full = _util.count_matrices(
@@ -276,7 +276,12 @@ def count_matrices(
                 lag, sliding=sliding, sparse_return=True, nstates=nstates)
     if sparse_return:
         return C_K
-    return _np.array([C.toarray() for C in C_K], dtype=_np.intc)
+    # fill one preallocated dense block instead of stacking a list of
+    # per-state dense copies
+    C = _np.empty(shape=(nthermo, nstates, nstates), dtype=_np.intc)
+    for K in range(nthermo):
+        C_K[K].astype(_np.intc, copy=False).toarray(out=C[K])
+    return C
 
 def state_counts(ttrajs, dtrajs, nstates=None, nthermo=None):
     # TODO: fix docstring
@@ -300,7 +305,6 @@ def state_counts(ttrajs, dtrajs, nstates=None, nthermo=None):
     cdef:
         int kmax = int(_np.max([t.max() for t in ttrajs]))
         int nmax = int(_np.max([d.max() for d in dtrajs]))
-        int K, i
     if nthermo is None:
         nthermo = kmax + 1
     elif nthermo < kmax + 1:
@@ -309,13 +313,12 @@ def state_counts(ttrajs, dtrajs, nstates=None, nthermo=None):
         nstates = nmax + 1
     elif nstates < nmax + 1:
         raise ValueError("nstates is smaller than the number of observed microstates")
-    N = _np.zeros(shape=(nthermo, nstates), dtype=_np.intc)
-    for d, t in zip(dtrajs, ttrajs):
-        for K in range(nthermo):
-            idx = (t == K)
-            for i in range(nstates):
-                N[K, i] += _np.sum(_np.logical_and(idx, (d == i)))
-    return N
+    # count all (K, i) pairs of all trajectories at once via their flat index
+    t = _np.concatenate(ttrajs).astype(_np.intp)
+    d = _np.concatenate(dtrajs)
+    valid = _np.logical_and(t >= 0, d >= 0)
+    N = _np.bincount(t[valid] * nstates + d[valid], minlength=nthermo * nstates)
+    return N.astype(_np.intc).reshape((nthermo, nstates))
 
 def restrict_samples_to_cset(state_sequence, bias_energy_sequence, cset):
     r"""
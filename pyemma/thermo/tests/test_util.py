@@ -19,6 +19,85 @@ import unittest
 import numpy as np
 import pyemma.thermo.util.util as util
 
+# ==================================================================================================
+# tests for discrete estimation helpers
+# ==================================================================================================
+
+class TestAveragedBiasMatrix(unittest.TestCase):
+
+    @staticmethod
+    def _reference_bias_matrix(bias_sequences, dtrajs, nstates):
+        # exponential average of every state's frames, one trajectory at a time
+        from pyemma.thermo.extensions.util import logsumexp, logsumexp_pair
+        nthermo = bias_sequences[0].shape[1]
+        bias_matrix = -np.ones(shape=(nthermo, nstates), dtype=np.float64) * np.inf
+        counts = np.zeros(shape=(nstates,), dtype=np.intc)
+        for bias_sequence, dtraj in zip(bias_sequences, dtrajs):
+            for i in range(nstates):
+                idx = (dtraj == i)
+                if idx.sum() == 0:
+                    continue
+                counts[i] += idx.sum()
+                for k in range(nthermo):
+                    bias_matrix[k, i] = logsumexp_pair(
+                        bias_matrix[k, i],
+                        logsumexp(np.ascontiguousarray(-bias_sequence[idx, k]), inplace=False))
+        idx = counts.nonzero()
+        bias_matrix *= -1.0
+        bias_matrix[:, idx] += np.log(counts[idx])[np.newaxis, :]
+        return bias_matrix
+
+    def test_get_averaged_bias_matrix(self):
+        rng = np.random.RandomState(0)
+        bias_sequences = [3.0 * rng.randn(n, 4) for n in (100, 37, 250)]
+        # unassigned frames, an unvisited state, and an unassigned-only trajectory
+        dtrajs = [rng.randint(-1, 7, size=n) for n in (100, 37)]
+        for dtraj in dtrajs:
+            dtraj[dtraj == 3] = 4
+        dtrajs.append(-np.ones(250, dtype=int))
+        for nstates in (None, 9):
+            bias_matrix = util.get_averaged_bias_matrix(bias_sequences, dtrajs, nstates=nstates)
+            ref_bias_matrix = self._reference_bias_matrix(
+                bias_sequences, dtrajs, 7 if nstates is None else nstates)
+            np.testing.assert_allclose(bias_matrix, ref_bias_matrix, rtol=1e-12)
+
+class TestStateCounts(unittest.TestCase):
+
+    @staticmethod
+    def _reference_state_counts(ttrajs, dtrajs, nthermo, nstates):
+        # count every (K, i) pair separately; negative states are never matched
+        N = np.zeros(shape=(nthermo, nstates), dtype=np.intc)
+        for ttraj, dtraj in zip(ttrajs, dtrajs):
+            for K in range(nthermo):
+                for i in range(nstates):
+                    N[K, i] += np.logical_and(ttraj == K, dtraj == i).sum()
+        return N
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        # unassigned frames in both the thermodynamic and the configurational state trajectories
+        self.ttrajs = [rng.randint(-1, 3, size=n).astype(np.intc) for n in (100, 37, 250)]
+        self.dtrajs = [rng.randint(-1, 5, size=n).astype(np.intc) for n in (100, 37, 250)]
+
+    def test_state_counts(self):
+        from pyemma.thermo.extensions.util import state_counts
+        N = state_counts(self.ttrajs, self.dtrajs)
+        self.assertEqual(N.dtype, np.intc)
+        np.testing.assert_array_equal(
+            N, self._reference_state_counts(self.ttrajs, self.dtrajs, 3, 5))
+
+    def test_state_counts_overrides(self):
+        from pyemma.thermo.extensions.util import state_counts
+        N = state_counts(self.ttrajs, self.dtrajs, nstates=7, nthermo=4)
+        self.assertEqual(N.dtype, np.intc)
+        self.assertEqual(N.shape, (4, 7))
+        np.testing.assert_array_equal(
+            N, self._reference_state_counts(self.ttrajs, self.dtrajs, 4, 7))
+        with self.assertRaises(ValueError):
+            state_counts(self.ttrajs, self.dtrajs, nstates=4)
+        with self.assertRaises(ValueError):
+            state_counts(self.ttrajs, self.dtrajs, nthermo=2)
+
 # ==================================================================================================
 # tests for protected umbrella sampling convenience functions
 # ==================================================================================================
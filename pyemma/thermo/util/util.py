@@ -52,7 +52,8 @@ def get_averaged_bias_matrix(bias_sequences, dtrajs, nstates=None):
         bias_energies_full[j, i] is the bias energy in units of kT for each discrete state i
         at thermodynamic state j.
     """
-    from pyemma.thermo.extensions.util import (logsumexp as _logsumexp, logsumexp_pair as _logsumexp_pair)
+    from pyemma.thermo.extensions.util import logsumexp as _logsumexp
+    from pyemma.thermo.extensions.util import logsumexp_pair as _logsumexp_pair
 
     nmax = int(_np.max([dtraj.max() for dtraj in dtrajs]))
     if nstates is None:
@@ -62,20 +63,21 @@ def get_averaged_bias_matrix(bias_sequences, dtrajs, nstates=None):
     nthermo = bias_sequences[0].shape[1]
     bias_matrix = -_np.ones(shape=(nthermo, nstates), dtype=_np.float64) * _np.inf
     counts = _np.zeros(shape=(nstates,), dtype=_np.intc)
-    for s in range(len(bias_sequences)):
-        for i in range(nstates):
-            idx = (dtrajs[s] == i)
-            nidx = idx.sum()
-            if nidx == 0:
-                continue
-            counts[i] += nidx
-            selected_bias_sequence = bias_sequences[s][idx, :]
+    for bias_sequence, dtraj in zip(bias_sequences, dtrajs):
+        # sort this trajectory's frames by their Markov state once, so that the frames of
+        # state i are order[offsets[i]:offsets[i + 1]]
+        valid = _np.flatnonzero(dtraj >= 0)
+        order = valid[_np.argsort(dtraj[valid], kind='mergesort')]
+        local_counts = _np.bincount(dtraj[valid], minlength=nstates)
+        offsets = _np.concatenate(([0], _np.cumsum(local_counts)))
+        for i in _np.flatnonzero(local_counts):
+            # row k holds the negated bias energies of state i's frames in thermodynamic state k
+            block = _np.negative(
+                bias_sequence[order[offsets[i]:offsets[i + 1]]].T, dtype=_np.float64, order='C')
             for k in range(nthermo):
                 bias_matrix[k, i] = _logsumexp_pair(
-                    bias_matrix[k, i],
-                    _logsumexp(
-                        _np.ascontiguousarray(-selected_bias_sequence[:, k]),
-                        inplace=False))
+                    bias_matrix[k, i], _logsumexp(block[k], inplace=True))
+        counts += local_counts.astype(_np.intc)
     idx = counts.nonzero()
     log_counts = _np.log(counts[idx])
     bias_matrix *= -1.0
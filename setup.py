@@ -119,6 +119,11 @@ def extensions():
                   sources=['pyemma/_ext/orderedset/_orderedset.pyx'],
                   extra_compile_args=['-std=c99'] + common_cflags)
 
+    plots_histogram = \
+        Extension('pyemma.plots._ext.histogram',
+                  sources=['pyemma/plots/_ext/histogram.pyx'],
+                  extra_compile_args=['-std=c99'] + common_cflags)
+
     extra_compile_args = ["-O3", "-std=c99"]
     ext_bar = Extension(
         "pyemma.thermo.extensions.bar",
@@ -195,7 +200,8 @@ def extensions():
     exts = [clustering_module,
             covar_module,
             eig_qr_module,
-            orderedset
+            orderedset,
+            plots_histogram
     ]
     exts += exts_thermo
 
@@ -299,7 +305,7 @@ metadata = dict(
         'matplotlib',
         'mdtraj>=1.9.2',
         'msmtools>=1.2',
-        'numpy>=1.8.0',
+        'numpy>=1.17',
         'pathos',
         'psutil>=3.1.1',
         'pyyaml',